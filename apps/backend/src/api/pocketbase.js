@@ -1,9 +1,6 @@
-import { readFileSync, mkdirSync, writeFileSync } from 'fs';
-import { join, dirname } from 'path';
-import { fileURLToPath } from 'url';
-
-const __dirname = dirname(fileURLToPath(import.meta.url));
-const config = JSON.parse(readFileSync(join(__dirname, '../../config.json'), 'utf-8'));
+import { mkdirSync, writeFileSync } from 'fs';
+import { join } from 'path';
+import { config } from '../config.js';
 
 const API_URL = config.pocketbase.url;
 const COLLECTION = config.pocketbase.collection;
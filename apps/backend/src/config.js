@@ -0,0 +1,11 @@
+import { readFileSync } from 'fs';
+import { join, dirname } from 'path';
+import { fileURLToPath } from 'url';
+
+const __dirname = dirname(fileURLToPath(import.meta.url));
+
+/**
+ * Shorts generator settings from config.json
+ * Read and parsed once per process; every module imports this instance
+ */
+export const config = JSON.parse(readFileSync(join(__dirname, '../config.json'), 'utf-8'));
@@ -5,17 +5,44 @@ import ora from 'ora';
 import inquirer from 'inquirer';
 import { fetchPhotos, downloadImage } from './api/pocketbase.js';
 import { generateVideo, TRANSITIONS } from './video/generator.js';
-import { readFileSync, mkdirSync, existsSync, readdirSync } from 'fs';
+import { config } from './config.js';
+import { mkdirSync, existsSync, readdirSync } from 'fs';
 import { join, dirname } from 'path';
 import { fileURLToPath } from 'url';
 
 const __dirname = dirname(fileURLToPath(import.meta.url));
-const config = JSON.parse(readFileSync(join(__dirname, '../config.json'), 'utf-8'));
 
 // Ensure temp directory exists
 const tempDir = join(__dirname, '../temp');
 mkdirSync(tempDir, { recursive: true });
 
+// Date formatters (built once; toLocale*String re-resolves the locale per call)
+const dateTimeFormat = new Intl.DateTimeFormat('ko-KR', {
+  year: 'numeric',
+  month: 'numeric',
+  day: 'numeric',
+  hour: 'numeric',
+  minute: 'numeric',
+  second: 'numeric'
+});
+const dateFormat = new Intl.DateTimeFormat('ko-KR');
+
+/**
+ * Format a date value; format() throws on invalid dates, so keep
+ * toLocaleString's "Invalid Date" for missing or unparseable values
+ * @param {Intl.DateTimeFormat} fmt
+ * @param {string} value
+ * @returns {string}
+ */
+function formatDate(fmt, value) {
+  const date = new Date(value);
+  if (Number.isNaN(date.getTime())) return String(date);
+  return fmt.format(date);
+}
+
+// Max simultaneous image downloads from PocketBase
+const DOWNLOAD_CONCURRENCY = 4;
+
 const program = new Command();
 
 program
@@ -43,12 +70,14 @@ program
         return;
       }
 
-      console.log('\n' + chalk.bold('📸 최근 사진 목록:'));
+      // Build the whole listing first and write it once
+      const lines = ['\n' + chalk.bold('📸 최근 사진 목록:')];
       photos.forEach((photo, i) => {
-        const date = new Date(photo.created).toLocaleString('ko-KR');
-        console.log(`  ${chalk.gray(`[${i + 1}]`)} ${chalk.white(photo.title)} ${chalk.dim(`(${date})`)}`);
-        console.log(`      ${chalk.dim(photo.id)}`);
+        const date = formatDate(dateTimeFormat, photo.created);
+        lines.push(`  ${chalk.gray(`[${i + 1}]`)} ${chalk.white(photo.title)} ${chalk.dim(`(${date})`)}`);
+        lines.push(`      ${chalk.dim(photo.id)}`);
       });
+      console.log(lines.join('\n'));
     } catch (err) {
       spinner.fail('조회 실패: ' + err.message);
       console.error(chalk.dim(err.stack));
@@ -73,10 +102,11 @@ program
 
       if (options.ids) {
         // ID로 직접 지정
-        const ids = options.ids.split(',').map(id => id.trim());
+        // Set: 중복 ID 제거 + O(1) 조회
+        const ids = new Set(options.ids.split(',').map(id => id.trim()));
         const spinner = ora('사진 조회 중...').start();
         const allPhotos = await fetchPhotos({ limit: 100 });
-        selectedPhotos = allPhotos.filter(p => ids.includes(p.id));
+        selectedPhotos = allPhotos.filter(p => ids.has(p.id));
         spinner.succeed(`${selectedPhotos.length}개 사진 선택됨`);
       } else {
         // 사진 조회
@@ -96,7 +126,7 @@ program
         } else {
           // 대화형 모드
           const choices = photos.map((p, i) => ({
-            name: `${p.title} (${new Date(p.created).toLocaleDateString('ko-KR')})`,
+            name: `${p.title} (${formatDate(dateFormat, p.created)})`,
             value: p,
             checked: i < 5
           }));
@@ -148,10 +178,31 @@ program
       // 이미지 다운로드
       const downloadSpinner = ora('이미지 다운로드 중...').start();
 
-      for (let i = 0; i < selectedPhotos.length; i++) {
-        const photo = selectedPhotos[i];
-        photo.localPath = await downloadImage(photo, tempDir);
-        downloadSpinner.text = `이미지 다운로드 중... (${i + 1}/${selectedPhotos.length})`;
+      // 병렬 다운로드 (고정 개수 워커가 공유 인덱스에서 하나씩 가져감)
+      // 하나라도 실패하면 나머지 워커도 새 다운로드를 시작하지 않음
+      let nextIndex = 0;
+      let downloaded = 0;
+      let failed = false;
+      const worker = async () => {
+        while (!failed && nextIndex < selectedPhotos.length) {
+          const photo = selectedPhotos[nextIndex++];
+          try {
+            photo.localPath = await downloadImage(photo, tempDir);
+          } catch (err) {
+            failed = true;
+            throw err;
+          }
+          if (failed) return;
+          downloaded++;
+          downloadSpinner.text = `이미지 다운로드 중... (${downloaded}/${selectedPhotos.length})`;
+        }
+      };
+      const workerCount = Math.min(DOWNLOAD_CONCURRENCY, selectedPhotos.length);
+      try {
+        await Promise.all(Array.from({ length: workerCount }, worker));
+      } catch (err) {
+        downloadSpinner.fail('이미지 다운로드 실패');
+        throw err;
       }
       downloadSpinner.succeed('이미지 다운로드 완료');
 
@@ -200,7 +251,7 @@ program
     console.log(chalk.bold('\n⚙️  현재 설정:'));
     console.log(chalk.dim(JSON.stringify(config, null, 2)));
     console.log('\n' + chalk.bold('🎞️  사용 가능한 전환 효과:'));
-    TRANSITIONS.forEach(t => console.log(`  - ${t}`));
+    console.log(TRANSITIONS.map(t => `  - ${t}`).join('\n'));
   });
 
 program.parse();
@@ -26,6 +26,9 @@ export async function generateVideo(photos, options = {}) {
     ? join(__dirname, '../../', subtitleConfig.font)
     : join(__dirname, '../../assets/fonts/NotoSansKR-Bold.otf');
 
+  // Check the font once instead of once per clip
+  const resolvedFontPath = existsSync(fontPath) ? fontPath : undefined;
+
   // Build clips with Ken Burns effect and subtitles
   const clips = photos.map((photo, index) => {
     const layers = [
@@ -43,7 +46,7 @@ export async function generateVideo(photos, options = {}) {
       layers.push({
         type: 'title',
         text: formatSubtitle(photo.title, 15),
-        fontPath: existsSync(fontPath) ? fontPath : undefined,
+        fontPath: resolvedFontPath,
         fontSize: subtitleConfig.fontSize || 60,
         textColor: subtitleConfig.textColor || '#FFFFFF',
         position: { y: 0.85 }
@@ -4,7 +4,8 @@
 
 import { db } from './db.js';
 
-const API_URL = 'http://localhost:8090';
+// Backend URL (override per deployment via VITE_API_URL)
+const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:8090';
 
 class SyncManager {
   constructor() {
@@ -50,15 +51,16 @@ class SyncManager {
    * Sync all pending/failed items
    */
   async syncAll() {
-    const pending = await db.upload_queue
+    // Keys only: uploadOne() loads each item (and its image data) when it runs
+    const pendingIds = await db.upload_queue
       .where('status')
       .anyOf(['pending', 'failed'])
-      .toArray();
+      .primaryKeys();
 
-    console.log(`🔄 Syncing ${pending.length} items`);
+    console.log(`🔄 Syncing ${pendingIds.length} items`);
 
-    for (const item of pending) {
-      await this.uploadOne(item.id);
+    for (const id of pendingIds) {
+      await this.uploadOne(id);
     }
   }
 
@@ -126,13 +128,14 @@ class SyncManager {
    * @returns {Promise<Object>} { pending, uploading, completed, failed }
    */
   async getStats() {
-    const all = await db.upload_queue.toArray();
-    return {
-      pending: all.filter(x => x.status === 'pending').length,
-      uploading: all.filter(x => x.status === 'uploading').length,
-      completed: all.filter(x => x.status === 'completed').length,
-      failed: all.filter(x => x.status === 'failed').length
-    };
+    // Count on the status index so queued image data is never loaded
+    const [pending, uploading, completed, failed] = await Promise.all(
+      ['pending', 'uploading', 'completed', 'failed'].map(status =>
+        db.upload_queue.where('status').equals(status).count()
+      )
+    );
+
+    return { pending, uploading, completed, failed };
   }
 }
 
@@ -86,16 +86,17 @@ export const jobsAPI = {
       // Validate job data
       validateJobData(jobData);
 
-      const id = await db.jobs.add({
+      const job = {
         ...jobData,
         created_at: jobData.created_at || Date.now(),
         updated_at: Date.now()
-      });
+      };
 
-      const job = await db.jobs.get(id);
+      // Return the inserted record directly (no read-back query)
+      const id = await db.jobs.add(job);
 
       return {
-        data: job,
+        data: { ...job, id },
         error: null
       };
     } catch (error) {
@@ -136,17 +137,21 @@ export const jobsAPI = {
                 ? await db.photos.where('job_id').anyOf(jobIds).toArray()
                 : [];
 
-              // Group photos by job_id (in-memory)
-              const photosByJob = allPhotos.reduce((acc, photo) => {
-                if (!acc[photo.job_id]) acc[photo.job_id] = [];
-                acc[photo.job_id].push(photo);
-                return acc;
-              }, {});
+              // Group photos by job_id (in-memory, one lookup per photo)
+              const photosByJob = new Map();
+              for (const photo of allPhotos) {
+                const list = photosByJob.get(photo.job_id);
+                if (list) {
+                  list.push(photo);
+                } else {
+                  photosByJob.set(photo.job_id, [photo]);
+                }
+              }
 
               // Attach photos to jobs (sorted by sequence)
               const jobsWithPhotos = jobs.map(job => ({
                 ...job,
-                photos: (photosByJob[job.id] || []).sort((a, b) => a.sequence - b.sequence)
+                photos: (photosByJob.get(job.id) || []).sort((a, b) => a.sequence - b.sequence)
               }));
 
               return callback({ data: jobsWithPhotos, error: null });
@@ -250,14 +255,16 @@ export const photosAPI = {
       // Handle single object or array
       const dataArray = Array.isArray(photosData) ? photosData : [photosData];
 
-      const ids = await db.photos.bulkAdd(
-        dataArray.map(photo => ({
-          ...photo,
-          uploaded_at: photo.uploaded_at || Date.now()
-        }))
-      );
+      const photos = dataArray.map(photo => ({
+        ...photo,
+        uploaded_at: photo.uploaded_at || Date.now()
+      }));
 
-      const photos = await db.photos.bulkGet(ids);
+      // allKeys returns every generated id, so no bulkGet read-back is needed
+      const ids = await db.photos.bulkAdd(photos, { allKeys: true });
+      photos.forEach((photo, i) => {
+        photo.id = ids[i];
+      });
 
       return {
         data: photos,
@@ -328,15 +335,16 @@ export const usersAPI = {
    */
   async create(userData) {
     try {
-      const id = await db.users.add({
+      const user = {
         ...userData,
         created_at: Date.now()
-      });
+      };
 
-      const user = await db.users.get(id);
+      // Return the inserted record directly (no read-back query)
+      const id = await db.users.add(user);
 
       return {
-        data: user,
+        data: { ...user, id },
         error: null
       };
     } catch (error) {
@@ -87,10 +87,13 @@ export async function closeDB() {
  */
 export async function clearAllData() {
   try {
-    await db.jobs.clear();
-    await db.photos.clear();
-    await db.users.clear();
-    await db.settings.clear();
+    // One transaction for all tables (atomic, single commit)
+    await db.transaction('rw', db.jobs, db.photos, db.users, db.settings, async () => {
+      await db.jobs.clear();
+      await db.photos.clear();
+      await db.users.clear();
+      await db.settings.clear();
+    });
     console.log('🗑️ All data cleared');
   } catch (error) {
     console.error('❌ Failed to clear data:', error);
@@ -104,13 +107,23 @@ export async function clearAllData() {
  */
 export async function exportDatabase() {
   try {
+    // Read all tables concurrently from one consistent snapshot
+    const [jobs, photos, users, settings] = await db.transaction('r', db.jobs, db.photos, db.users, db.settings, () =>
+      Promise.all([
+        db.jobs.toArray(),
+        db.photos.toArray(),
+        db.users.toArray(),
+        db.settings.toArray()
+      ])
+    );
+
     const data = {
       version: 1,
       timestamp: Date.now(),
-      jobs: await db.jobs.toArray(),
-      photos: await db.photos.toArray(),
-      users: await db.users.toArray(),
-      settings: await db.settings.toArray()
+      jobs,
+      photos,
+      users,
+      settings
     };
 
     console.log('📤 Database exported:', {
@@ -137,16 +150,19 @@ export async function importDatabase(data) {
       throw new Error(`Unsupported database version: ${data.version}`);
     }
 
-    // Clear existing data
-    await clearAllData();
-
-    // Import data
-    await db.jobs.bulkAdd(data.jobs);
-    await db.photos.bulkAdd(data.photos);
-    await db.users.bulkAdd(data.users);
-    if (data.settings) {
-      await db.settings.bulkAdd(data.settings);
-    }
+    // Clear + import in one transaction (atomic restore, single commit)
+    await db.transaction('rw', db.jobs, db.photos, db.users, db.settings, async () => {
+      // Clear existing data
+      await clearAllData();
+
+      // Import data
+      await db.jobs.bulkAdd(data.jobs);
+      await db.photos.bulkAdd(data.photos);
+      await db.users.bulkAdd(data.users);
+      if (data.settings) {
+        await db.settings.bulkAdd(data.settings);
+      }
+    });
 
     console.log('📥 Database imported:', {
       jobs: data.jobs.length,
@@ -165,21 +181,25 @@ export async function importDatabase(data) {
  */
 export async function getDatabaseStats() {
   try {
-    const stats = {
-      jobs: await db.jobs.count(),
-      photos: await db.photos.count(),
-      users: await db.users.count(),
-      settings: await db.settings.count()
-    };
+    // Count all tables concurrently within one read transaction
+    const stats = await db.transaction('r', db.jobs, db.photos, db.users, db.settings, async () => {
+      const [jobs, photos, users, settings] = await Promise.all([
+        db.jobs.count(),
+        db.photos.count(),
+        db.users.count(),
+        db.settings.count()
+      ]);
+      return { jobs, photos, users, settings };
+    });
 
     // Calculate total storage size (approximate)
-    const photos = await db.photos.toArray();
-    const totalSize = photos.reduce((sum, photo) => {
+    // Stream with a cursor so only one photo's image data is held at a time
+    let totalSize = 0;
+    await db.photos.each(photo => {
       if (photo.image_data) {
-        return sum + photo.image_data.length;
+        totalSize += photo.image_data.length;
       }
-      return sum;
-    }, 0);
+    });
 
     stats.totalStorageBytes = totalSize;
     stats.totalStorageMB = (totalSize / 1024 / 1024).toFixed(2);
@@ -251,13 +271,15 @@ export async function getTempPhotos(sessionId) {
       .equals(sessionId)
       .toArray();
 
-    // Group by category
+    // Group by category (one lookup per photo)
     const grouped = {};
     for (const photo of photos) {
-      if (!grouped[photo.category]) {
-        grouped[photo.category] = [];
+      const list = grouped[photo.category];
+      if (list) {
+        list.push(photo);
+      } else {
+        grouped[photo.category] = [photo];
       }
-      grouped[photo.category].push(photo);
     }
 
     return grouped;
@@ -269,7 +291,7 @@ export async function getTempPhotos(sessionId) {
 
 /**
  * Get temp photos count by category for a session
- * Optimized: Uses filter + count instead of toArray to avoid loading image data
+ * Optimized: Counts on the [session_id+category] index (no records/image data loaded)
  * @param {string} sessionId - Session identifier
  * @returns {Promise<Object>} - Count per category
  */
@@ -277,12 +299,11 @@ export async function getTempPhotosCount(sessionId) {
   const categories = ['before_car', 'before_wheel', 'during', 'after_wheel', 'after_car'];
 
   try {
-    // Count each category in parallel (no image data loaded)
+    // Count each category in parallel (index-only, no image data loaded)
     const countPromises = categories.map(async (category) => {
       const count = await db.temp_photos
-        .where('session_id')
-        .equals(sessionId)
-        .filter(photo => photo.category === category)
+        .where('[session_id+category]')
+        .equals([sessionId, category])
         .count();
       return [category, count];
     });
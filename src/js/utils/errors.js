@@ -132,7 +132,8 @@ export function handleError(error, showMessage = alert, logError = console.error
 }
 
 // Non-retryable error types (these should fail immediately)
-const NON_RETRYABLE_ERRORS = [
+// Set for O(1) name lookup on every failed attempt
+const NON_RETRYABLE_ERRORS = new Set([
   'QuotaExceededError',     // Storage quota exceeded
   'SecurityError',          // Security policy violation
   'NotAllowedError',        // Permission denied
@@ -143,7 +144,7 @@ const NON_RETRYABLE_ERRORS = [
   'RangeError',             // Invalid range
   'ValidationError',        // Invalid input
   'AuthError'               // Authentication required
-];
+]);
 
 // Non-retryable error messages (substring matches)
 const NON_RETRYABLE_MESSAGES = [
@@ -170,7 +171,7 @@ export function isRetryableError(error) {
   }
 
   // Check for explicitly non-retryable error types
-  if (NON_RETRYABLE_ERRORS.includes(error.name)) {
+  if (NON_RETRYABLE_ERRORS.has(error.name)) {
     // Exception: TypeError from fetch is retryable (network issue)
     if (error.name === 'TypeError' && error.message?.includes('fetch')) {
       return true;
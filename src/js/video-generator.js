@@ -18,6 +18,18 @@ const MIME_TYPES = [
   'video/webm'                 // Generic WebM
 ];
 
+// Category display order (입고 → 문제 → 과정 → 해결 → 출고)
+const CATEGORY_ORDER = ['before_car', 'before_wheel', 'during', 'after_wheel', 'after_car'];
+
+// Category labels for the top bar (module-level: drawn on every frame)
+const CATEGORY_LABELS = {
+  before_car: '입고',
+  before_wheel: '문제',
+  during: '과정',
+  after_wheel: '해결',
+  after_car: '출고'
+};
+
 /**
  * Detect iOS device
  * @returns {boolean}
@@ -70,11 +82,26 @@ function getFormatInfo(mimeType) {
   return { extension: 'webm', type: 'video/webm' };
 }
 
+// Device capabilities do not change within a page session; detect once
+let cachedCapabilities = null;
+
 /**
- * Check device video generation capabilities
+ * Check device video generation capabilities (cached after the first call)
  * @returns {Object} - { supported, mimeType, message, needsServerConversion }
  */
 export function checkVideoCapabilities() {
+  if (!cachedCapabilities) {
+    // Frozen: every caller shares this object for the whole session
+    cachedCapabilities = Object.freeze(detectVideoCapabilities());
+  }
+  return cachedCapabilities;
+}
+
+/**
+ * Detect device video generation capabilities
+ * @returns {Object} - { supported, mimeType, message, needsServerConversion }
+ */
+function detectVideoCapabilities() {
   const isIOS = isIOSDevice();
   const safari = isSafari();
   const supported = isMediaRecorderSupported();
@@ -178,6 +205,16 @@ export async function generateMarketingVideo(photos, jobInfo, options = {}) {
   const totalDuration = images.length * photoDuration;
   const totalFrames = (totalDuration / 1000) * fps;
 
+  // Per-video constants (computed once, not per frame)
+  const photoLayouts = images.map(img => calculateFitDimensions(img, width, height * 0.7));
+  const fadeInEnd = transitionDuration / photoDuration;
+  const fadeOutStart = 1 - (transitionDuration / photoDuration);
+
+  // Background gradient (identical for every frame)
+  const backgroundGradient = ctx.createLinearGradient(0, 0, 0, height);
+  backgroundGradient.addColorStop(0, '#667eea');
+  backgroundGradient.addColorStop(1, '#764ba2');
+
   return new Promise((resolve, reject) => {
     let timeoutId = null;
     let isCompleted = false;
@@ -222,6 +259,7 @@ export async function generateMarketingVideo(photos, jobInfo, options = {}) {
 
     // Animation loop
     let frame = 0;
+    let lastProgress = -1;
     const interval = 1000 / fps;
 
     const renderFrame = () => {
@@ -238,22 +276,16 @@ export async function generateMarketingVideo(photos, jobInfo, options = {}) {
         const photoProgress = (currentTime % photoDuration) / photoDuration;
 
         // Clear canvas with gradient background
-        const gradient = ctx.createLinearGradient(0, 0, 0, height);
-        gradient.addColorStop(0, '#667eea');
-        gradient.addColorStop(1, '#764ba2');
-        ctx.fillStyle = gradient;
+        ctx.fillStyle = backgroundGradient;
         ctx.fillRect(0, 0, width, height);
 
         // Draw current photo
         if (photoIndex < images.length) {
           const img = images[photoIndex];
-          const { x, y, w, h } = calculateFitDimensions(img, width, height * 0.7);
+          const { x, y, w, h } = photoLayouts[photoIndex];
 
           // Fade effect
           let alpha = 1;
-          const fadeInEnd = transitionDuration / photoDuration;
-          const fadeOutStart = 1 - (transitionDuration / photoDuration);
-
           if (photoProgress < fadeInEnd) {
             alpha = photoProgress / fadeInEnd;
           } else if (photoProgress > fadeOutStart) {
@@ -269,9 +301,13 @@ export async function generateMarketingVideo(photos, jobInfo, options = {}) {
         const currentPhoto = photos[photoIndex] || {};
         drawTextOverlay(ctx, jobInfo, photoIndex, images.length, width, height, currentPhoto.category);
 
-        // Progress callback
+        // Progress callback (only when the percentage changes, not every frame)
         if (onProgress) {
-          onProgress(Math.round((frame / totalFrames) * 100));
+          const progress = Math.round((frame / totalFrames) * 100);
+          if (progress !== lastProgress) {
+            lastProgress = progress;
+            onProgress(progress);
+          }
         }
 
         frame++;
@@ -340,15 +376,7 @@ function calculateFitDimensions(img, containerWidth, containerHeight) {
  * @param {string} category - Photo category key
  */
 function drawTextOverlay(ctx, jobInfo, photoIndex, totalPhotos, width, height, category) {
-  // Category labels mapping
-  const categoryLabels = {
-    before_car: '입고',
-    before_wheel: '문제',
-    during: '과정',
-    after_wheel: '해결',
-    after_car: '출고'
-  };
-  const currentCategory = categoryLabels[category] || `${photoIndex + 1}/${totalPhotos}`;
+  const currentCategory = CATEGORY_LABELS[category] || `${photoIndex + 1}/${totalPhotos}`;
 
   // Top bar with category
   ctx.fillStyle = 'rgba(0, 0, 0, 0.5)';
@@ -417,9 +445,8 @@ export async function generateAndDownloadVideo(photos, jobInfo, onProgress) {
     }
 
     // Sort photos by category order, then by sequence within each category
-    const categoryOrder = ['before_car', 'before_wheel', 'during', 'after_wheel', 'after_car'];
     const sortedPhotos = [...photos].sort((a, b) => {
-      const categoryDiff = categoryOrder.indexOf(a.category) - categoryOrder.indexOf(b.category);
+      const categoryDiff = CATEGORY_ORDER.indexOf(a.category) - CATEGORY_ORDER.indexOf(b.category);
       if (categoryDiff !== 0) return categoryDiff;
       return (a.sequence || 0) - (b.sequence || 0);
     });
@@ -0,0 +1,52 @@
+// Photo Factory - Sanitizer Module Tests
+import { describe, it, expect } from 'vitest';
+import { escapeHtml, sanitizeObject, sanitizeFilename } from '../../src/js/utils/sanitizer.js';
+
+describe('Sanitizer Module', () => {
+  describe('escapeHtml()', () => {
+    it('should escape all HTML special characters', () => {
+      expect(escapeHtml(`<a href="x">Tom & 'Jerry'</a>`))
+        .toBe('&lt;a href=&quot;x&quot;&gt;Tom &amp; &#039;Jerry&#039;&lt;/a&gt;');
+    });
+
+    it('should escape ampersands in existing entities', () => {
+      expect(escapeHtml('&lt;')).toBe('&amp;lt;');
+    });
+
+    it('should return empty string for null/undefined', () => {
+      expect(escapeHtml(null)).toBe('');
+      expect(escapeHtml(undefined)).toBe('');
+    });
+
+    it('should stringify non-string values', () => {
+      expect(escapeHtml(42)).toBe('42');
+    });
+
+    it('should be stable across repeated calls', () => {
+      expect(escapeHtml('<b>')).toBe('&lt;b&gt;');
+      expect(escapeHtml('<b>')).toBe('&lt;b&gt;');
+    });
+  });
+
+  describe('sanitizeObject()', () => {
+    it('should escape only the given keys', () => {
+      const result = sanitizeObject({ title: '<i>', note: '<i>' }, ['title']);
+      expect(result).toEqual({ title: '&lt;i&gt;', note: '<i>' });
+    });
+  });
+
+  describe('sanitizeFilename()', () => {
+    it('should replace invalid characters and parent directory segments', () => {
+      expect(sanitizeFilename('../a<b>:c?.txt')).toBe('__a_b__c_.txt');
+    });
+
+    it('should replace dot pairs left to right', () => {
+      expect(sanitizeFilename('a...b')).toBe('a_.b');
+      expect(sanitizeFilename('..\\..\\x')).toBe('____x');
+    });
+
+    it('should default to unnamed', () => {
+      expect(sanitizeFilename('')).toBe('unnamed');
+    });
+  });
+});